@@ -4,6 +4,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL")
     DATABASE_API_KEY: str = os.getenv("DATABASE_API_KEY")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    POKEMON_LOG_STDOUT: bool = False
 
     class Config:
         env_file = ".env"
@@ -1,7 +1,14 @@
-from supabase import create_client, Client
+from supabase import acreate_client, AsyncClient
 from app.core.config import settings
 
-supabase: Client = create_client(settings.DATABASE_URL, settings.DATABASE_API_KEY)
+supabase: AsyncClient = None
 
-def get_supabase() -> Client:
-    return supabase
\ No newline at end of file
+async def init_supabase() -> AsyncClient:
+    """Create the shared async Supabase client, awaited once at startup"""
+    global supabase
+    if supabase is None:
+        supabase = await acreate_client(settings.DATABASE_URL, settings.DATABASE_API_KEY)
+    return supabase
+
+def get_supabase() -> AsyncClient:
+    return supabase
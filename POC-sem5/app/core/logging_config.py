@@ -1,12 +1,21 @@
+import asyncio
+import gzip
 import logging
+import queue
+import shutil
 import time
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from functools import wraps
 from typing import Callable
 import os
+from app.core.config import settings
 
-# Create logs directory if it doesn't exist
-os.makedirs("logs", exist_ok=True)
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+LOG_DIR = "logs"
 
 class PokemonFormatter(logging.Formatter):
     """Custom formatter for Pokemon API logs"""
@@ -30,90 +39,198 @@ class PokemonFormatter(logging.Formatter):
             formatted_message = f"DEBUG - {formatted_message}"
             
         return formatted_message
+
+class BufferedRotatingFileHandler(TimedRotatingFileHandler):
+    """Midnight-rotating file handler with a large write buffer and gzipped backups.
+
+    Records are flushed every `flush_every` records or on errors.
+    """
+    
+    def __init__(self, filename, encoding=None, buffer_size=65536, flush_every=100, backup_count=14):
+        self.buffer_size = buffer_size
+        self.flush_every = flush_every
+        self._pending = 0
+        super().__init__(filename, when='midnight', backupCount=backup_count, encoding=encoding, utc=True)
+        self.namer = lambda name: f"{name}.gz"
+        self.rotator = _gzip_rotator
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=self.buffer_size)
+    
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record, which defeats the buffer
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.flush_every or record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        self._pending = 0
+        super().flush()
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+output_handlers = []
+log_listener = None
+_slot_lock = None
+
+def _claim_log_file() -> str:
+    """Pick a log file that no other live process writes to.
+
+    Each process holds an exclusive lock on logs/.pokemon_api.<slot>.lock, so N workers
+    always reuse the same N files across restarts and respawns. Slot 0, which a single
+    process always gets, writes to pokemon_api.log.
+    """
+    global _slot_lock
+    slot = 0
+    if fcntl is not None:
+        while True:
+            lock = open(os.path.join(LOG_DIR, f".pokemon_api.{slot}.lock"), "w")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                slot += 1
+                continue
+            # Held until shutdown_logging or process exit
+            _slot_lock = lock
+            break
+    
+    name = "pokemon_api.log" if slot == 0 else f"pokemon_api.{slot}.log"
+    return os.path.join(LOG_DIR, name)
+
+def configure_logging():
+    """Install the queue-based logging handlers; safe to call more than once"""
+    global log_listener
+    if log_listener is not None:
+        return
+    
+    # Create logs directory if it doesn't exist
+    os.makedirs(LOG_DIR, exist_ok=True)
+    
+    # One file per worker: each worker rotates its own file, so workers never
+    # rename or gzip a file another worker is still writing to
+    log_file = _claim_log_file()
+    
+    # {Fecha}{Modulo}{API}{Funcion} Message
+    output_handlers.append(BufferedRotatingFileHandler(log_file, encoding='utf-8'))
+    
+    # stdout is usually captured by the process supervisor, so only log there when asked to
+    if settings.POKEMON_LOG_STDOUT:
+        output_handlers.append(logging.StreamHandler())
+    
+    # Apply custom formatter to all handlers
+    for handler in output_handlers:
+        handler.setFormatter(PokemonFormatter())
+    
+    # Request code only enqueues records; a background thread does the formatting and I/O
+    log_queue = queue.Queue(-1)
+    log_listener = QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    logging.root.setLevel(logging.INFO)
+    logging.root.addHandler(QueueHandler(log_queue))
+    log_listener.start()
+    
+    # Requests are already logged by our middleware; keep uvicorn's access log off the root handlers
+    logging.getLogger("uvicorn.access").propagate = False
     
-# {Fecha}{Modulo}{API}{Funcion} Message
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [POKEMON-SERVICE] [%(name)s] [%(funcName)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(
-            filename=f"logs/pokemon_api_{datetime.now().strftime('%Y%m%d')}.log",
-            mode='a',
-            encoding='utf-8'
-        )
-    ]
-)
-
-# Apply custom formatter to all handlers
-for handler in logging.root.handlers:
-    handler.setFormatter(PokemonFormatter())
+    config_logger = get_logger("logging_config")
+    config_logger.info("Pokemon API logging system initialized")
+    config_logger.info("Log files will be saved to: %s (rotated daily at UTC midnight)", log_file)
+    config_logger.info("Logging format: {Fecha}[POKEMON-SERVICE][Module][Function] Message")
+
+def shutdown_logging():
+    """Flush pending records and stop the background logging thread"""
+    global log_listener, _slot_lock
+    if log_listener is None:
+        return
+    
+    log_listener.stop()
+    log_listener = None
+    for handler in logging.root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            logging.root.removeHandler(handler)
+    for handler in output_handlers:
+        handler.close()
+    output_handlers.clear()
+    
+    if _slot_lock is not None:
+        _slot_lock.close()
+        _slot_lock = None
 
 def get_logger(module_name: str):
-    """Get logger for specific module"""
+    """Get logger for specific module, level taken from LOG_LEVEL (use WARNING in production)"""
     logger = logging.getLogger(module_name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(settings.LOG_LEVEL.upper())
     return logger
 
 def log_execution_time(logger: logging.Logger):
-    """Decorator to log execution time for latency measurement"""
+    """Decorator to log execution time for latency measurement.
+
+    Failures are always logged; successful calls only when the logger is at DEBUG level.
+    """
     def decorator(func: Callable):
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            function_name = func.__name__
-            logger.info(f"Starting execution - {function_name}")
-            
-            try:
-                result = await func(*args, **kwargs)
-                end_time = time.time()
-                execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-                logger.info(f"Completed execution - {function_name} - Duration: {execution_time:.2f}ms")
+        function_name = func.__name__
+
+        def log_success(start_ns: int):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Completed execution - %s - Duration: %.2fms",
+                             function_name, (time.perf_counter_ns() - start_ns) / 1e6)
+
+        def log_failure(start_ns: int, error: Exception):
+            logger.error("Failed execution - %s - Duration: %.2fms - Error: %s",
+                         function_name, (time.perf_counter_ns() - start_ns) / 1e6, error)
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    log_failure(start_ns, e)
+                    raise
+                log_success(start_ns)
                 return result
-            except Exception as e:
-                end_time = time.time()
-                execution_time = (end_time - start_time) * 1000
-                logger.error(f"Failed execution - {function_name} - Duration: {execution_time:.2f}ms - Error: {str(e)}")
-                raise
+            return async_wrapper
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
-            function_name = func.__name__
-            logger.info(f"Starting execution - {function_name}")
-            
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                end_time = time.time()
-                execution_time = (end_time - start_time) * 1000
-                logger.info(f"Completed execution - {function_name} - Duration: {execution_time:.2f}ms")
-                return result
             except Exception as e:
-                end_time = time.time()
-                execution_time = (end_time - start_time) * 1000
-                logger.error(f"Failed execution - {function_name} - Duration: {execution_time:.2f}ms - Error: {str(e)}")
+                log_failure(start_ns, e)
                 raise
-        
-        # Check if function is async
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+            log_success(start_ns)
+            return result
+        return sync_wrapper
     return decorator
 
 # Utility function to log database operations
 def log_database_operation(logger: logging.Logger, operation: str, table: str, params: dict = None):
     """Log database operations with standardized format"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     params_str = f" with params: {params}" if params else ""
-    logger.info(f"Database operation - {operation} on table '{table}'{params_str}")
+    logger.info("Database operation - %s on table '%s'%s", operation, table, params_str)
 
 # Utility function to log API responses
 def log_api_response(logger: logging.Logger, endpoint: str, status_code: int, response_size: int = None):
     """Log API responses with standardized format"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     size_str = f" - Size: {response_size} bytes" if response_size else ""
-    logger.info(f"API response - {endpoint} - Status: {status_code}{size_str}")
+    logger.info("API response - %s - Status: %s%s", endpoint, status_code, size_str)
 
 # Performance monitoring utilities
 class PerformanceMonitor:
@@ -126,7 +243,7 @@ class PerformanceMonitor:
     
     def __enter__(self):
         self.start_time = time.time()
-        self.logger.info(f"Starting operation - {self.operation_name}")
+        self.logger.info("Starting operation - %s", self.operation_name)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -134,12 +251,7 @@ class PerformanceMonitor:
         execution_time = (end_time - self.start_time) * 1000
         
         if exc_type:
-            self.logger.error(f"Operation failed - {self.operation_name} - Duration: {execution_time:.2f}ms - Error: {exc_val}")
+            self.logger.error("Operation failed - %s - Duration: %.2fms - Error: %s", self.operation_name, execution_time, exc_val)
         else:
-            self.logger.info(f"Operation completed - {self.operation_name} - Duration: {execution_time:.2f}ms")
-
+            self.logger.info("Operation completed - %s - Duration: %.2fms", self.operation_name, execution_time)
 
-config_logger = get_logger("logging_config")
-config_logger.info("Pokemon API logging system initialized")
-config_logger.info(f"Log files will be saved to: logs/pokemon_api_{datetime.now().strftime('%Y%m%d')}.log")
-config_logger.info("Logging format: {Fecha}[POKEMON-SERVICE][Module][Function] Message")
\ No newline at end of file
@@ -1,16 +1,39 @@
 import os
+from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 
 router = APIRouter()
-IMAGE_FOLDER = os.path.join(os.getcwd(), "app/static/images")
+IMAGE_FOLDER = Path(__file__).resolve().parent.parent.parent / "static/images"
+IMAGE_INDEX_REFRESH_SECONDS = 60
+
+def _scan_images() -> dict:
+    """Map lowercased filename -> actual filename for every file in IMAGE_FOLDER"""
+    try:
+        with os.scandir(IMAGE_FOLDER) as entries:
+            return {entry.name.lower(): entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+# Looked up instead of stat'ing the disk on every request
+_images = _scan_images()
+
+def refresh_image_index():
+    """Re-read IMAGE_FOLDER so added or removed images are picked up"""
+    global _images
+    _images = _scan_images()
 
 @router.get("/image-alt/{pokemon_name}")
 def get_image_fallback(pokemon_name: str):
-    filename = f"{pokemon_name.lower()}.png"
-    image_path = os.path.join(IMAGE_FOLDER, filename)
+    filename = _images.get(f"{pokemon_name.lower()}.png")
+    if filename is None:
+        raise HTTPException(status_code=404, detail="Image not found")
 
-    if os.path.exists(image_path):
-        return FileResponse(image_path, media_type="image/png")
+    path = IMAGE_FOLDER / filename
+    # The index can be stale, so the file may have been removed since the last refresh
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Image not found")
     
-    raise HTTPException(status_code=404, detail="Image not found")
+    return FileResponse(path, media_type="image/png", stat_result=stat_result)
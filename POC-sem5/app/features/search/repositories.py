@@ -36,44 +36,54 @@ import time
 # Get logger for this module
 logger = get_logger("pokemon_stats")
 
+STATS_REFRESH_SECONDS = 300
+# Supabase caps responses at 1000 rows, so the table is read in pages
+STATS_PAGE_SIZE = 1000
+
+# Columns returned by get_stats_from_db, in response order
+STATS_COLUMNS = ("HP", "Attack", "Defense", "Sp. Atk", "Sp. Def", "Speed")
+_STATS_SELECT = ",".join(f'"{column}"' for column in STATS_COLUMNS)
+
+# The whole stats table (<2000 rows), keyed by lowercased name
+_stats_table = {}
+
 @log_execution_time(logger)
-def get_stats_from_db(pokemon_name: str):
-    """Get Pokemon stats from database with logging"""
-    logger.info(f"Fetching stats for Pokemon: {pokemon_name}")
-    
+async def load_stats_table() -> dict:
+    """Fetch every row of the stats table from the database"""
     supabase = get_supabase()
-    search_name = pokemon_name.lower()
+    table = {}
+    offset = 0
     
-    try:
-        # Log database query start
-        logger.info(f"Executing database query for: {search_name}")
-        response = supabase.table("stats").select("*").ilike("Name", search_name).execute()
+    while True:
+        response = await (
+            supabase.table("stats")
+            .select(f'"Name",{_STATS_SELECT}')
+            # A stable order keeps pages from skipping or repeating rows
+            .order("Name")
+            .range(offset, offset + STATS_PAGE_SIZE - 1)
+            .execute()
+        )
+        for record in response.data:
+            table[record["Name"].lower()] = [record[column] for column in STATS_COLUMNS]
         
-        if response.data:
-            record = response.data[0]
-            stats = [
-                record.get("HP"),
-                record.get("Attack"),
-                record.get("Defense"),
-                record.get("Sp. Atk"),
-                record.get("Sp. Def"),
-                record.get("Speed")
-            ]
-            logger.info(f"Successfully retrieved stats for {pokemon_name}: {stats}")
-            return stats
-        else:
-            logger.warning(f"No stats found for Pokemon: {pokemon_name}")
-            return []
-            
-    except Exception as e:
-        logger.error(f"Database error while fetching stats for {pokemon_name}: {str(e)}")
-        raise
+        if len(response.data) < STATS_PAGE_SIZE:
+            return table
+        offset += STATS_PAGE_SIZE
+
+async def refresh_stats_table():
+    """Reload the in-memory stats table, keeping the previous one on failure"""
+    global _stats_table
+    _stats_table = await load_stats_table()
+    logger.info("Stats table loaded with %d Pokemon", len(_stats_table))
+
+def get_stats_from_db(pokemon_name: str):
+    """Get Pokemon stats from the in-memory copy of the stats table.
+
+    `pokemon_name` must already be stripped and lowercased by the caller.
+    """
+    return list(_stats_table.get(pokemon_name, []))
 
-@log_execution_time(logger)
 def get_image_url(pokemon_name: str, base_url: str = "http://localhost:8000"):
-    """Generate image URL with logging"""
-    logger.info(f"Generating image URL for Pokemon: {pokemon_name}")
-    url = f"{base_url}/images/{pokemon_name.lower()}/0.jpg"
-    logger.info(f"Generated image URL: {url}")
-    return url
+    """Generate image URL, `pokemon_name` must already be lowercased"""
+    return f"{base_url}/images/{pokemon_name}/0.jpg"
 
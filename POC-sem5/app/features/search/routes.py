@@ -1,9 +1,39 @@
-from fastapi import APIRouter
+import msgspec
+from fastapi import APIRouter, HTTPException, Request, Response
 from app.features.search.schemas import SearchRequest, SearchResponse
 from app.features.search.services import search_pokemon
 
 router = APIRouter()
 
-@router.post("/search", response_model=SearchResponse)
-async def search(request: SearchRequest):
-    return await search_pokemon(request.Pokemon_Name)
+# msgspec handles (de)serialization on this hot path, so describe the schemas for the docs by hand
+_decoder = msgspec.json.Decoder(SearchRequest)
+_, _schemas = msgspec.json.schema_components([SearchRequest, SearchResponse])
+
+@router.post(
+    "/search",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _schemas["SearchRequest"]}}
+        },
+        "responses": {
+            "200": {
+                "description": "Successful Response",
+                "content": {"application/json": {"schema": _schemas["SearchResponse"]}}
+            }
+        }
+    }
+)
+async def search(request: Request):
+    try:
+        body = _decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    content, etag = await search_pokemon(body.Pokemon_Name, request.app.state.http)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
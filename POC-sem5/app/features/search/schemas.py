@@ -1,10 +1,10 @@
-from pydantic import BaseModel
+import msgspec
 from typing import List
 
-class SearchRequest(BaseModel):
+class SearchRequest(msgspec.Struct):
     Pokemon_Name: str
 
-class SearchResponse(BaseModel):
+class SearchResponse(msgspec.Struct):
     name: str
     stats: List[int]
     image: str
@@ -1,18 +1,37 @@
+import hashlib
+from typing import Tuple
 import httpx
-from app.features.search.repositories import get_stats_from_db, get_image_url
+import msgspec
+import orjson
+from app.core.cache import TTLCache
+from app.features.search.schemas import SearchResponse
+from app.features.search.repositories import STATS_REFRESH_SECONDS, get_stats_from_db, get_image_url
 
-async def search_pokemon(name: str):
-    async with httpx.AsyncClient() as client:
-        poke_api_url = f"https://pokeapi.co/api/v2/pokemon/{name.lower()}"
-        response = await client.get(poke_api_url)
-        data = response.json()
-        
-    
-    stats = get_stats_from_db(name)  
-    image_url = get_image_url(name)  
+# Encoded response body and ETag per lowercased name; expires with the stats table refresh
+_response_cache = TTLCache(maxsize=512, ttl=STATS_REFRESH_SECONDS)
+_encoder = msgspec.json.Encoder()
 
-    return {
-        "name": data["name"],
-        "stats": stats,
-        "image": image_url
-    }
+async def _fetch_pokeapi_name(client: httpx.AsyncClient, name: str) -> str:
+    response = await client.get(f"https://pokeapi.co/api/v2/pokemon/{name}")
+    return orjson.loads(response.content)["name"]
+
+async def search_pokemon(name: str, client: httpx.AsyncClient) -> Tuple[bytes, str]:
+    """Return the encoded SearchResponse body and its ETag"""
+    search_name = name.strip().lower()
+    cached = _response_cache.get(search_name)
+    if cached is not None:
+        return cached
+
+    pokemon_name = await _fetch_pokeapi_name(client, search_name)
+    stats = get_stats_from_db(search_name)
+    image_url = get_image_url(search_name)
+
+    body = _encoder.encode(SearchResponse(
+        name=pokemon_name,
+        stats=stats,
+        image=image_url
+    ))
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    _response_cache.set(search_name, (body, etag))
+    return body, etag
@@ -1,42 +1,92 @@
+import asyncio
+import httpx
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from app.features.search.routes import router as search_router
+from app.features.search.repositories import STATS_REFRESH_SECONDS, refresh_stats_table
 from app.features.poke_img.routes import router as image_router  # Optional
-from app.core.database import get_supabase
-from app.core.logging_config import get_logger, log_execution_time
+from app.features.poke_img.routes import IMAGE_INDEX_REFRESH_SECONDS, refresh_image_index
+from app.core.database import get_supabase, init_supabase
+from app.core.logging_config import configure_logging, get_logger, shutdown_logging
+import itertools
 import time
 
 
 # Get logger for main API
 api_logger = get_logger("pokemon_main_api")
 
+# Only 1 in REQ_SAMPLE successful requests is logged by the middleware
+REQ_SAMPLE = 100
+_request_counter = itertools.count()
+
+async def refresh_periodically(refresh, interval: float):
+    """Run a refresh function every `interval` seconds, blocking ones in a worker thread"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if asyncio.iscoroutinefunction(refresh):
+                await refresh()
+            else:
+                await asyncio.to_thread(refresh)
+        except Exception as e:
+            api_logger.error("Periodic refresh %s failed: %s", refresh.__name__, e)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan with logging"""
+    configure_logging()
     start_time = time.time()
     api_logger.info("Starting Pokemon API application")
+    refresh_tasks = []
     
     try:
         # Initialize Supabase connection
         api_logger.info("Initializing Supabase connection")
-        get_supabase()
+        await init_supabase()
         api_logger.info("Supabase connection initialized successfully")
+
+        # Serve stats from memory; a failed load is retried by the refresh task
+        try:
+            await refresh_stats_table()
+        except Exception:
+            api_logger.warning("Starting with an empty stats table")
+
+        # Shared HTTP client so pokeapi requests reuse pooled keep-alive connections
+        app.state.http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+        )
+        api_logger.info("HTTP client initialized")
+
+        refresh_tasks = [
+            asyncio.create_task(refresh_periodically(refresh_image_index, IMAGE_INDEX_REFRESH_SECONDS)),
+            asyncio.create_task(refresh_periodically(refresh_stats_table, STATS_REFRESH_SECONDS))
+        ]
         
         startup_time = (time.time() - start_time) * 1000
-        api_logger.info(f"Application startup completed - Duration: {startup_time:.2f}ms")
+        api_logger.info("Application startup completed - Duration: %.2fms", startup_time)
         
         yield
         
     except Exception as e:
-        api_logger.error(f"Error during application startup: {str(e)}")
+        api_logger.error("Error during application startup: %s", e)
         raise
     finally:
         api_logger.info("Shutting down Pokemon API application")
+        for task in refresh_tasks:
+            task.cancel()
+        http_client = getattr(app.state, "http", None)
+        if http_client is not None:
+            await http_client.aclose()
+        shutdown_logging()
 
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="Pokemon API",
     description="Pokemon API with stats and images",
     version="1.0.0"
@@ -52,22 +102,29 @@ app.add_middleware(
 
 @app.middleware("http")
 async def log_requests(request, call_next):
-    """Log all HTTP requests and responses"""
+    """Log a sample of HTTP requests and every failed one"""
     start_time = time.time()
-    client_ip = request.client.host if request.client else "unknown"
-    method = request.method
-    url = str(request.url)
+    sampled = next(_request_counter) % REQ_SAMPLE == 0
     
-    api_logger.info(f"Incoming request - {method} {url} from {client_ip}")
+    if sampled:
+        client_ip = request.client.host if request.client else "unknown"
+        api_logger.info("Incoming request - %s %s from %s", request.method, request.url, client_ip)
     
     try:
         response = await call_next(request)
         process_time = (time.time() - start_time) * 1000
         
-        api_logger.info(
-            f"Request completed - {method} {url} - "
-            f"Status: {response.status_code} - Duration: {process_time:.2f}ms"
-        )
+        if response.status_code >= 500:
+            # Server errors are logged unsampled and above INFO so they survive LOG_LEVEL=WARNING
+            api_logger.warning(
+                "Request completed - %s %s - Status: %s - Duration: %.2fms",
+                request.method, request.url, response.status_code, process_time
+            )
+        elif sampled:
+            api_logger.info(
+                "Request completed - %s %s - Status: %s - Duration: %.2fms",
+                request.method, request.url, response.status_code, process_time
+            )
         
         # Add custom header with response time
         response.headers["X-Process-Time"] = str(process_time)
@@ -76,8 +133,8 @@ async def log_requests(request, call_next):
     except Exception as e:
         process_time = (time.time() - start_time) * 1000
         api_logger.error(
-            f"Request failed - {method} {url} - "
-            f"Error: {str(e)} - Duration: {process_time:.2f}ms"
+            "Request failed - %s %s - Error: %s - Duration: %.2fms",
+            request.method, request.url, e, process_time
         )
         raise
 
@@ -94,7 +151,6 @@ app.mount("/images", StaticFiles(directory="app/static/images"), name="images")
 
 # extra endpoints
 @app.get("/health")
-@log_execution_time(api_logger)
 async def health_check():
     """Health check endpoint with logging"""
     api_logger.info("Health check requested")
@@ -111,7 +167,7 @@ async def health_check():
             "timestamp": time.time()
         }
     except Exception as e:
-        api_logger.error(f"Health check failed: {str(e)}")
+        api_logger.error("Health check failed: %s", e)
         return {
             "status": "unhealthy",
             "service": "pokemon-api",
@@ -122,7 +178,6 @@ async def health_check():
 
 # Root endpoint
 @app.get("/")
-@log_execution_time(api_logger)
 async def root():
     """Root endpoint with basic API information"""
     api_logger.info("Root endpoint accessed")
@@ -2,114 +2,436 @@
 """
 Pokemon API Monitoring Bot
 Console application for monitoring API performance and availability
+
+Setup: pip install -r requirements.txt (the bot's own dependencies, separate from POC-sem5's)
+Run:   python monitoringbot.py
 """
 
 import os
+import signal
 import sys
 import time
-import json
-import requests
-import statistics
+import orjson
+from array import array
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
-from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, replace
+from collections import OrderedDict, defaultdict
 import threading
-import subprocess
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# requests, numpy, pyarrow and subprocess are imported where they are used so the
+# menu comes up without paying for them; repeat imports are just a sys.modules lookup
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RequestResult:
     """Data class to store request results"""
     timestamp: datetime
     status_code: int
-    response_time: float
+    response_time_ns: int
     endpoint: str
     success: bool
+    attempts: int = 1
+    
+    @property
+    def response_time(self) -> float:
+        """Response time in milliseconds"""
+        return self.response_time_ns / 1e6
+
+
+@lru_cache(maxsize=None)
+def _result_schema():
+    import pyarrow as pa
+    return pa.schema([
+        ("ts", pa.timestamp("us")),
+        ("code", pa.int16()),
+        ("rt_ms", pa.float32()),
+        ("endpoint", pa.dictionary(pa.int8(), pa.string())),
+        ("success", pa.bool_()),
+    ])
+
+
+class ResultStore:
+    """Append-only Arrow IPC stream log of request results, one file per writer session"""
+    
+    COLUMNS = ("ts", "code", "rt_ms", "endpoint", "success")
+    BATCH_SIZE = 256
+    
+    def __init__(self, directory: str = "monitor_data"):
+        self.directory = directory
+        self._writer = None
+        self._rows: Dict[str, list] = {name: [] for name in self.COLUMNS}
+    
+    def append(self, result: RequestResult):
+        """Buffer a result, writing a record batch every BATCH_SIZE rows"""
+        rows = self._rows
+        rows["ts"].append(result.timestamp)
+        rows["code"].append(result.status_code)
+        rows["rt_ms"].append(result.response_time)
+        rows["endpoint"].append(result.endpoint)
+        rows["success"].append(result.success)
+        if len(rows["ts"]) >= self.BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered rows to the current file, opening one if needed"""
+        if not self._rows["ts"]:
+            return
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        
+        if self._writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"results_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.arrows")
+            # Stream format: every complete batch stays readable even if the bot dies mid-session
+            self._writer = ipc.new_stream(path, _result_schema())
+        self._writer.write_batch(pa.RecordBatch.from_pydict(self._rows, schema=_result_schema()))
+        for column in self._rows.values():
+            column.clear()
+    
+    def close(self):
+        """Flush and finish the current file; the next append starts a new one"""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+    
+    def load(self) -> "pyarrow.Table":
+        """All stored results, including rows not yet written"""
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        
+        self.close()
+        if not os.path.isdir(self.directory):
+            return _result_schema().empty_table()
+        
+        batches = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".arrows"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with ipc.open_stream(path) as reader:
+                    # Decode batch by batch so a truncated tail only loses the last partial batch
+                    for batch in reader:
+                        batches.append(batch)
+            except (pa.ArrowInvalid, OSError) as e:
+                print(f"⚠️  Skipping unreadable part of {path}: {e}")
+        return pa.Table.from_batches(batches, schema=_result_schema())
+    
+    def daily_series(self, data_type: str, endpoint: str, days: int) -> Tuple[List[str], List[float]]:
+        """Per-day mean latency (ms) or availability (%) for the last `days` days that have data"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        table = self.load()
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
+        table = table.filter(pc.and_(
+            pc.equal(table["endpoint"].cast(pa.string()), endpoint),
+            pc.greater_equal(table["ts"], pa.scalar(start, pa.timestamp("us")))
+        ))
+        if table.num_rows == 0:
+            return [], []
+        
+        if data_type.lower() == "latency":
+            value, scale = table["rt_ms"], 1
+        else:
+            value, scale = pc.cast(table["success"], pa.float64()), 100
+        
+        daily = (
+            pa.table({"day": pc.cast(table["ts"], pa.date32()), "value": value})
+            .group_by("day")
+            .aggregate([("value", "mean")])
+            .sort_by("day")
+        )
+        labels = [day.strftime("%m/%d") for day in daily["day"].to_pylist()]
+        return labels, [mean * scale for mean in daily["value_mean"].to_pylist()]
 
 
 class APIMonitor:
     """Main monitoring class for Pokemon API"""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    CACHE_MAX_ENTRIES = 128
+    RETRY_STATUSES = frozenset((502, 503, 504))
+    # Availability report label per failed status class (code // 100)
+    STATUS_LABELS = {4: "❌ CLIENT ERROR", 5: "❌ ERROR"}
+    
+    def __init__(self, base_url: str = "http://localhost:8000", cache_ttl: float = 0,
+                 max_retries: int = 3, retry_backoff: float = 0.3, store: Optional[ResultStore] = None,
+                 concurrency: int = 20):
+        self._urls: Dict[str, str] = {}
+        # Last ETag seen per endpoint, sent back as If-None-Match so unchanged bodies come back as 304
+        self._etags: Dict[str, str] = {}
         self.base_url = base_url
-        self.results: List[RequestResult] = []
+        # Every sample is persisted; the in-memory columns below only hold the current run
+        self.store = store or ResultStore()
+        # Samples stored column-wise (structure of arrays) so stats run over contiguous buffers
+        self.timestamps: List[datetime] = []
+        self.status_codes = array('i')
+        self.latencies_ns = array('q')
+        self.successes = bytearray()
+        self.attempts = array('H')
         self.running = False
         
+        # Connection failures and 502/503/504 responses are retried in _request, with exponential backoff
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        
+        # Short-lived results per (endpoint, method, payload) to collapse bursts; cache_ttl=0 disables it
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[tuple, Tuple[float, RequestResult]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Requests in flight during availability checks; also sizes the connection pool
+        self.concurrency = concurrency
+        
+        # Keep-alive session, created on the first request
+        self._session = None
+        self._session_lock = threading.Lock()
+        
+        # Default request body, serialized once instead of on every request
+        self._default_body = orjson.dumps({"Pokemon_Name": "pikachu"})
+    
+    @property
+    def session(self):
+        """Shared keep-alive session so repeated checks reuse the same connection"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._new_session()
+        return self._session
+    
+    def _new_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+        return session
+    
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value
+        self._urls.clear()
+        self._etags.clear()
+    
+    def _url(self, endpoint: str) -> str:
+        """Full URL for an endpoint, built once per base URL"""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = f"{self.base_url}{endpoint}"
+        return url
+        
     def test_endpoint(self, endpoint: str, method: str = "POST", payload: dict = None) -> RequestResult:
         """Test a single endpoint and return result"""
-        start_time = time.time()
-        
-        try:
-            if method == "POST":
-                response = requests.post(
-                    f"{self.base_url}{endpoint}",
-                    json=payload or {"Pokemon_Name": "pikachu"},
-                    headers={"Content-Type": "application/json"},
-                    timeout=30
-                )
-            else:
-                response = requests.get(f"{self.base_url}{endpoint}", timeout=30)
+        if self.cache_ttl > 0:
+            cache_key = (endpoint, method, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = self._request(endpoint, method, payload)
+        
+        if self.cache_ttl > 0:
+            with self._cache_lock:
+                self._cache[cache_key] = (time.monotonic(), result)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return result
+    
+    def _cached_result(self, cache_key: tuple) -> Optional[RequestResult]:
+        """Cached result re-stamped with the current time, or None if missing or stale"""
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is None:
+                return None
+            cached_at, result = entry
+            if time.monotonic() - cached_at >= self.cache_ttl:
+                del self._cache[cache_key]
+                return None
+            self._cache.move_to_end(cache_key)
+        return replace(result, timestamp=datetime.now())
+    
+    def _request(self, endpoint: str, method: str, payload: dict) -> RequestResult:
+        """Perform one HTTP request against the API and time it, retrying transient failures"""
+        import requests
+        
+        etag = self._etags.get(endpoint)
+        headers = {"If-None-Match": etag} if etag else None
+        body = orjson.dumps(payload) if payload else self._default_body
+        attempts = 0
+        
+        while True:
+            attempts += 1
+            # Only the final attempt is timed; retry overhead shows up in `attempts`
+            start_ns = time.perf_counter_ns()
+            try:
+                if method == "POST":
+                    response = self.session.post(
+                        self._url(endpoint),
+                        data=body,
+                        headers=headers,
+                        timeout=30
+                    )
+                else:
+                    response = self.session.get(self._url(endpoint), headers=headers, timeout=30)
+                response_time_ns = time.perf_counter_ns() - start_ns
             
-            response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            success = response.status_code == 200
+            except (requests.ConnectionError, requests.Timeout):
+                if attempts > self.max_retries:
+                    return self._failed_result(endpoint, start_ns, attempts)
+                time.sleep(self.retry_backoff * 2 ** (attempts - 1))
+                continue
             
-            return RequestResult(
-                timestamp=datetime.now(),
-                status_code=response.status_code,
-                response_time=response_time,
-                endpoint=endpoint,
-                success=success
-            )
+            except requests.RequestException:
+                return self._failed_result(endpoint, start_ns, attempts)
             
-        except requests.RequestException as e:
-            response_time = (time.time() - start_time) * 1000
-            return RequestResult(
-                timestamp=datetime.now(),
-                status_code=500,
-                response_time=response_time,
-                endpoint=endpoint,
-                success=False
-            )
-    
-    def check_latency(self, endpoint: str = "/poke/search", duration_minutes: int = 5) -> Dict:
-        """Check latency for specified duration"""
+            if response.status_code not in self.RETRY_STATUSES or attempts > self.max_retries:
+                break
+            time.sleep(self.retry_backoff * 2 ** (attempts - 1))
+        
+        success = response.status_code in (200, 304)
+        
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._etags[endpoint] = new_etag
+        
+        return RequestResult(
+            timestamp=datetime.now(),
+            status_code=response.status_code,
+            response_time_ns=response_time_ns,
+            endpoint=endpoint,
+            success=success,
+            attempts=attempts
+        )
+    
+    def _failed_result(self, endpoint: str, start_ns: int, attempts: int) -> RequestResult:
+        return RequestResult(
+            timestamp=datetime.now(),
+            status_code=500,
+            response_time_ns=time.perf_counter_ns() - start_ns,
+            endpoint=endpoint,
+            success=False,
+            attempts=attempts
+        )
+    
+    def check_latency(self, endpoint: str = "/poke/search", duration_minutes: int = 5,
+                      requests_per_second: float = 0.5, max_workers: int = 8) -> Dict:
+        """Check latency for specified duration, sampling at a fixed rate from a thread pool"""
         print(f"\n🔍 Checking latency for {endpoint} during {duration_minutes} minutes...")
         print("Press Ctrl+C to stop early\n")
         
-        results = []
-        start_time = time.time()
-        end_time = start_time + (duration_minutes * 60)
-        
+        self._clear_samples()
+        completed = queue.Queue()
+        stop = threading.Event()
+        interval = 1 / requests_per_second
+        next_time = time.monotonic()
+        end_time = next_time + (duration_minutes * 60)
+        
+        def drain():
+            # Only the main thread prints, so output lines never interleave
+            while True:
+                try:
+                    future = completed.get_nowait()
+                except queue.Empty:
+                    return
+                if not future.cancelled():
+                    result = future.result()
+                    self._record(result)
+                    self._print_latency_result(result)
+        
+        # At most one request per worker in flight, so a slow server can't build up a backlog
+        slots = threading.BoundedSemaphore(max_workers)
+        skipped = 0
+        
+        def on_done(future):
+            slots.release()
+            completed.put(future)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
         try:
-            while time.time() < end_time:
-                result = self.test_endpoint(endpoint)
-                results.append(result)
-                
-                status_icon = "✅" if result.success else "❌"
-                print(f"{status_icon} {result.timestamp.strftime('%H:%M:%S')} | "
-                      f"Status: {result.status_code} | "
-                      f"Latency: {result.response_time:.2f}ms")
-                
-                time.sleep(2)  # Wait 2 seconds between requests
+            while not stop.is_set() and next_time < end_time:
+                if slots.acquire(blocking=False):
+                    executor.submit(self.test_endpoint, endpoint).add_done_callback(on_done)
+                else:
+                    # Every worker is busy: drop this sample rather than queue it
+                    skipped += 1
                 
+                # Fixed schedule: a slow response doesn't push back later samples
+                next_time += interval
+                drain()
+                stop.wait(max(0.0, next_time - time.monotonic()))
+            
+            # Duration is over; only the requests already in flight are waited for
+            executor.shutdown(wait=True, cancel_futures=True)
+        
         except KeyboardInterrupt:
+            stop.set()
             print("\n⏹️  Latency check stopped by user")
+            # Don't wait for requests still in flight; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        drain()
         
-        if results:
-            latencies = [r.response_time for r in results]
+        import numpy as np
+        
+        # Integer nanoseconds until here; converted to milliseconds only for the report
+        latencies = np.frombuffer(self.latencies_ns, dtype=np.int64) / 1e6
+        if latencies.size:
+            successes = np.frombuffer(self.successes, dtype=np.uint8)
+            attempts = np.frombuffer(self.attempts, dtype=np.uint16)
+            median, p95, p99 = np.percentile(latencies, [50, 95, 99])
             return {
                 "endpoint": endpoint,
                 "duration_minutes": duration_minutes,
-                "total_requests": len(results),
-                "avg_latency": statistics.mean(latencies),
-                "min_latency": min(latencies),
-                "max_latency": max(latencies),
-                "median_latency": statistics.median(latencies),
-                "success_rate": sum(1 for r in results if r.success) / len(results) * 100
+                "total_requests": int(latencies.size),
+                "avg_latency": float(latencies.mean()),
+                "min_latency": float(latencies.min()),
+                "max_latency": float(latencies.max()),
+                "median_latency": float(median),
+                "p95_latency": float(p95),
+                "p99_latency": float(p99),
+                "success_rate": float(np.count_nonzero(successes)) / latencies.size * 100,
+                "retried_requests": int(np.count_nonzero(attempts > 1)),
+                "total_retries": int(attempts.sum()) - int(attempts.size),
+                "skipped_samples": skipped
             }
         return {}
     
+    def _record(self, result: RequestResult):
+        """Append a sample to the column arrays"""
+        self.timestamps.append(result.timestamp)
+        self.status_codes.append(result.status_code)
+        self.latencies_ns.append(result.response_time_ns)
+        self.successes.append(result.success)
+        self.attempts.append(result.attempts)
+        self.store.append(result)
+    
+    def _clear_samples(self):
+        """Drop the previous run's in-memory samples (they are already in the store)"""
+        del self.timestamps[:]
+        del self.status_codes[:]
+        del self.latencies_ns[:]
+        del self.successes[:]
+        del self.attempts[:]
+    
+    def _print_latency_result(self, result: RequestResult):
+        status_icon = "✅" if result.success else "❌"
+        print(f"{status_icon} {result.timestamp.strftime('%H:%M:%S')} | "
+              f"Status: {result.status_code} | "
+              f"Latency: {result.response_time:.2f}ms")
+    
     def check_availability(self, endpoint: str = "/poke/search", days: int = 1) -> Dict:
         """Check availability for specified number of days"""
         print(f"\n📊 Checking availability for {endpoint} over {days} day(s)...")
@@ -118,26 +440,44 @@ class APIMonitor:
         # Simulate data collection over time (in real implementation, you'd query historical data)
         total_requests = min(100, days * 50)  # Simulate requests per day
         success_count = 0
-        error_count = 0
+        # Failed requests per status class (code // 100)
+        status_classes: Dict[int, int] = {}
         
-        for i in range(total_requests):
-            result = self.test_endpoint(endpoint)
-            
-            if result.status_code == 200:
-                success_count += 1
-                status = "✅ SUCCESS"
-            elif result.status_code >= 500:
-                error_count += 1
-                status = "❌ ERROR"
-            else:
-                status = "⚠️  OTHER"
+        self._clear_samples()
+        
+        # Requests go out concurrently over the shared session and are reported as they finish
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        completed = 0
+        try:
+            futures = [executor.submit(self.test_endpoint, endpoint) for _ in range(total_requests)]
             
-            print(f"Request {i+1:3d}/{total_requests} | {status} | "
-                  f"Code: {result.status_code} | "
-                  f"Time: {result.response_time:.2f}ms")
+            for future in as_completed(futures):
+                result = future.result()
+                completed += 1
+                self._record(result)
+                # Same success rule as the stored results, so the report matches the availability graph
+                if result.success:
+                    success_count += 1
+                    status = "✅ SUCCESS"
+                else:
+                    status_class = result.status_code // 100
+                    status_classes[status_class] = status_classes.get(status_class, 0) + 1
+                    status = self.STATUS_LABELS.get(status_class, "⚠️  OTHER")
+                
+                print(f"Request {completed:3d}/{total_requests} | {status} | "
+                      f"Code: {result.status_code} | "
+                      f"Time: {result.response_time:.2f}ms")
             
-            if i < total_requests - 1:
-                time.sleep(0.5)  # Small delay between requests
+            executor.shutdown()
+        
+        except KeyboardInterrupt:
+            print("\n⏹️  Availability check stopped by user")
+            # Drop queued requests and don't wait for the ones in flight
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        client_error_count = status_classes.get(4, 0)
+        server_error_count = status_classes.get(5, 0)
+        error_count = client_error_count + server_error_count
         
         # Calculate availability
         total_relevant = success_count + error_count
@@ -149,22 +489,28 @@ class APIMonitor:
         return {
             "endpoint": endpoint,
             "days": days,
-            "total_requests": total_requests,
+            "total_requests": completed,
             "success_count": success_count,
             "error_count": error_count,
+            "client_error_count": client_error_count,
+            "server_error_count": server_error_count,
             "availability_percentage": availability,
-            "success_rate": (success_count / total_requests) * 100 if total_requests > 0 else 0
+            "success_rate": (success_count / completed) * 100 if completed > 0 else 0
         }
     
     def render_graph(self, data_type: str = "latency", endpoint: str = "/poke/search", days: int = 7):
         """Render ASCII graph for trends"""
         print(f"\n📈 Rendering {data_type} graph for {endpoint} over {days} days...")
-        print("Generating sample data...\n")
         
-        # Generate sample data points
-        data_points = []
-        labels = []
+        labels, data_points = self.store.daily_series(data_type, endpoint, days)
+        if data_points:
+            print("Using stored monitoring data...\n")
+            self._draw_ascii_graph(data_points, labels, data_type)
+            return
+        
+        print("No stored data yet, generating sample data...\n")
         
+        # Generate sample data points
         for i in range(days):
             date = datetime.now() - timedelta(days=days-i-1)
             labels.append(date.strftime("%m/%d"))
@@ -186,39 +532,37 @@ class APIMonitor:
             print("No data to display")
             return
         
+        import numpy as np
+        
         # Normalize data for display
-        max_val = max(data)
-        min_val = min(data)
+        values = np.asarray(data, dtype=np.float64)
+        max_val = float(values.max())
+        min_val = float(values.min())
         height = 15  # Graph height in characters
         width = len(data)
         
-        # Create the graph grid
-        graph = [[' ' for _ in range(width)] for _ in range(height)]
+        value_range = max_val - min_val
         
-        # Plot the data points
-        for i, value in enumerate(data):
-            if max_val > min_val:
-                normalized = (value - min_val) / (max_val - min_val)
-                y = int((height - 1) * (1 - normalized))  # Invert Y axis
-            else:
-                y = height // 2
-            
-            graph[y][i] = '●'
-            
-            # Draw connecting lines
-            if i > 0:
-                prev_value = data[i-1]
-                if max_val > min_val:
-                    prev_normalized = (prev_value - min_val) / (max_val - min_val)
-                    prev_y = int((height - 1) * (1 - prev_normalized))
-                else:
-                    prev_y = height // 2
-                
-                # Draw line between points
-                start_y, end_y = sorted([prev_y, y])
-                for line_y in range(start_y, end_y + 1):
-                    if graph[line_y][i-1] == ' ':
-                        graph[line_y][i-1] = '│' if start_y != end_y else '●'
+        # Row of every point in one vectorized pass (Y axis inverted); a flat series sits mid-graph
+        norm = np.full_like(values, 0.5) if value_range == 0 else (values - min_val) / value_range
+        ys = ((height - 1) * (1 - norm)).astype(np.int32)
+        
+        # Y-axis label of every row, top to bottom
+        y_labels = (max_val - np.arange(height) / (height - 1) * value_range).tolist()
+        
+        # Vertical span of the line joining each point to the next one
+        line_lo = np.minimum(ys[:-1], ys[1:])
+        line_hi = np.maximum(ys[:-1], ys[1:])
+        
+        # Create the graph grid as one contiguous array of characters
+        graph = np.full((height, width), ' ', dtype='U1')
+        
+        # Draw every connecting line at once in the column of the earlier point
+        rows = np.arange(height)[:, None]
+        graph[:, :-1][(rows >= line_lo) & (rows <= line_hi)] = '│'
+        
+        # Plot the data points over the lines
+        graph[ys, np.arange(width)] = '●'
         
         # Print the title
         unit = "ms" if data_type.lower() == "latency" else "%"
@@ -226,14 +570,8 @@ class APIMonitor:
         print("─" * (width + 10))
         
         # Print the graph
-        for i, row in enumerate(graph):
-            # Y-axis labels
-            if max_val > min_val:
-                y_value = max_val - (i / (height - 1)) * (max_val - min_val)
-            else:
-                y_value = max_val
-            
-            print(f"{y_value:6.1f} │{''.join(row)}")
+        for y_value, row in zip(y_labels, graph):
+            print(f"{y_value:6.1f} │{''.join(row.tolist())}")
         
         # Print X-axis
         print("       └" + "─" * width)
@@ -247,6 +585,18 @@ class APIMonitor:
         print(f"  Max: {max_val:.2f} {unit}")
 
 
+# ANSI clear screen + cursor home, written directly instead of spawning `clear`/`cls`
+_CLEAR = "\x1b[2J\x1b[H"
+
+# Locust arguments per load test menu option (the host is added at run time)
+_LOCUST_PRESETS = {
+    "1": ("--users=50", "--spawn-rate=5", "--run-time=300s", "--headless"),
+    "2": ("--users=100", "--spawn-rate=10", "--run-time=600s", "--headless"),
+    "3": ("--users=200", "--spawn-rate=20", "--run-time=900s", "--headless"),
+    "5": (),
+}
+
+
 class MonitoringBot:
     """Main bot class with console menu"""
     
@@ -256,7 +606,8 @@ class MonitoringBot:
     
     def display_header(self):
         """Display bot header"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        sys.stdout.write(_CLEAR)
+        sys.stdout.flush()
         print("╔══════════════════════════════════════════════════════════════╗")
         print("║                 🤖 POKEMON API MONITORING BOT                ║")
         print("║                        Version 1.0                          ║")
@@ -286,8 +637,11 @@ class MonitoringBot:
         try:
             endpoint = input("Enter endpoint [/poke/search]: ").strip() or "/poke/search"
             duration = int(input("Enter duration in minutes [5]: ") or "5")
+            rate = float(input("Enter requests per second [0.5]: ") or "0.5")
+            if rate <= 0:
+                raise ValueError(rate)
             
-            result = self.monitor.check_latency(endpoint, duration)
+            result = self.monitor.check_latency(endpoint, duration, rate)
             
             if result:
                 print(f"\n📊 LATENCY REPORT")
@@ -299,7 +653,12 @@ class MonitoringBot:
                 print(f"Min Latency: {result['min_latency']:.2f}ms")
                 print(f"Max Latency: {result['max_latency']:.2f}ms")
                 print(f"Median Latency: {result['median_latency']:.2f}ms")
+                print(f"P95 Latency: {result['p95_latency']:.2f}ms")
+                print(f"P99 Latency: {result['p99_latency']:.2f}ms")
                 print(f"Success Rate: {result['success_rate']:.1f}%")
+                print(f"Retried Requests: {result['retried_requests']} ({result['total_retries']} retries)")
+                if result['skipped_samples']:
+                    print(f"Skipped Samples (all workers busy): {result['skipped_samples']}")
         
         except ValueError:
             print("❌ Invalid input. Please enter valid numbers.")
@@ -326,7 +685,8 @@ class MonitoringBot:
                 print(f"Period: {result['days']} day(s)")
                 print(f"Total Requests: {result['total_requests']}")
                 print(f"Successful Requests: {result['success_count']}")
-                print(f"Error Requests (5xx): {result['error_count']}")
+                print(f"Error Requests: {result['error_count']} "
+                      f"(4xx: {result['client_error_count']}, 5xx: {result['server_error_count']})")
                 print(f"Availability: {result['availability_percentage']:.2f}%")
                 print(f"Success Rate: {result['success_rate']:.1f}%")
                 
@@ -378,30 +738,26 @@ class MonitoringBot:
         try:
             choice = input("\nSelect configuration [1]: ").strip() or "1"
             
-            if choice == "1":
-                cmd = ["locust", "--host=http://localhost:8000", "--users=50", "--spawn-rate=5", "--run-time=300s", "--headless"]
-            elif choice == "2":
-                cmd = ["locust", "--host=http://localhost:8000", "--users=100", "--spawn-rate=10", "--run-time=600s", "--headless"]
-            elif choice == "3":
-                cmd = ["locust", "--host=http://localhost:8000", "--users=200", "--spawn-rate=20", "--run-time=900s", "--headless"]
+            if choice in _LOCUST_PRESETS:
+                args = _LOCUST_PRESETS[choice]
             elif choice == "4":
                 users = int(input("Number of users: "))
                 spawn_rate = int(input("Spawn rate: "))
                 duration = input("Duration (e.g., 300s): ")
-                cmd = ["locust", "--host=http://localhost:8000", f"--users={users}", f"--spawn-rate={spawn_rate}", f"--run-time={duration}", "--headless"]
-            elif choice == "5":
-                print("Starting Locust Web UI...")
-                print("Open http://localhost:8089 in your browser")
-                cmd = ["locust", "--host=http://localhost:8000"]
+                args = (f"--users={users}", f"--spawn-rate={spawn_rate}", f"--run-time={duration}", "--headless")
             else:
                 print("❌ Invalid choice")
                 return
             
+            if choice == "5":
+                print("Starting Locust Web UI...")
+                print("Open http://localhost:8089 in your browser")
+            
+            cmd = ["locust", f"--host={self.monitor.base_url}", *args]
             print(f"\n🏃 Running: {' '.join(cmd)}")
             print("Press Ctrl+C to stop the test")
             
-            # Execute locust command
-            subprocess.run(cmd, cwd=".")
+            self._run_locust(cmd)
             
         except ValueError:
             print("❌ Invalid input. Please enter valid numbers.")
@@ -412,6 +768,37 @@ class MonitoringBot:
         
         input("\nPress Enter to continue...")
     
+    def _run_locust(self, cmd: List[str]):
+        """Run locust, streaming its output line by line as it is produced"""
+        import subprocess
+        
+        proc = subprocess.Popen(
+            cmd,
+            cwd=".",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            # Own process group, so Ctrl+C is forwarded explicitly instead of racing the child
+            start_new_session=os.name == 'posix'
+        )
+        
+        try:
+            for line in proc.stdout:
+                print(line, end='')
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopping load test...")
+            if os.name == 'posix':
+                os.killpg(proc.pid, signal.SIGINT)
+            else:
+                proc.terminate()
+            # Locust prints its final stats after SIGINT
+            for line in proc.stdout:
+                print(line, end='')
+        finally:
+            proc.wait()
+    
     def handle_settings(self):
         """Handle settings configuration"""
         print("\n⚙️  SETTINGS")
@@ -428,6 +815,13 @@ class MonitoringBot:
     
     def run(self):
         """Main bot loop"""
+        try:
+            self._loop()
+        finally:
+            # Write out results still buffered in memory
+            self.monitor.store.close()
+    
+    def _loop(self):
         while self.running:
             self.display_header()
             self.display_menu()
@@ -463,6 +857,14 @@ class MonitoringBot:
 
 
 if __name__ == "__main__":
+    if os.name == 'nt':
+        # Older Windows consoles need ANSI escape processing switched on
+        try:
+            import colorama
+            colorama.just_fix_windows_console()
+        except ImportError:
+            pass
+    
     print("🚀 Starting Pokemon API Monitoring Bot...")
     bot = MonitoringBot()
     bot.run()
\ No newline at end of file